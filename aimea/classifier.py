@@ -0,0 +1,142 @@
+"""
+Structured-output classification of transcript lines via OpenAI/Azure OpenAI tool calling.
+"""
+import json
+import re
+
+LANGUAGES = ("en", "es")
+INTENTS = ("schedule_meeting", "send_message", "action_item", "other")
+# Accepted spellings for each language code besides the code itself
+LANGUAGE_ALIASES = {
+    "english": "en", "en-us": "en", "en-gb": "en", "en_us": "en", "en_gb": "en",
+    "spanish": "es", "español": "es", "espanol": "es", "es-es": "es", "es-mx": "es",
+    "es_es": "es", "es_mx": "es",
+}
+
+SYSTEM_PROMPT = (
+    "Classify the meeting transcript line: its language, the speaker's intent, "
+    "and short topics (e.g. \"budget\"). Reply only by calling classify_line."
+)
+
+# Fixed schema the model must fill in; forcing this tool keeps replies structured.
+CLASSIFY_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "classify_line",
+        "description": "Record the classification of a transcript line.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "language": {"type": "string", "enum": list(LANGUAGES)},
+                "intent": {"type": "string", "enum": list(INTENTS)},
+                "topics": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["language", "intent", "topics"],
+            "additionalProperties": False,
+        },
+    },
+}
+TOOL_CHOICE = {"type": "function", "function": {"name": "classify_line"}}
+
+_FENCE_RE = re.compile(r"^```[\w-]*\s*|\s*```$")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
+class ClassificationError(ValueError):
+    """Raised when a model reply cannot be parsed into a valid classification."""
+
+
+def _loads_lenient(raw: str) -> dict:
+    """Decode JSON, repairing code fences, surrounding prose and trailing commas."""
+    try:
+        return json.loads(raw)
+    except ValueError:
+        pass
+    text = _FENCE_RE.sub("", raw.strip())
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        raise ClassificationError("No JSON object in reply")
+    text = _TRAILING_COMMA_RE.sub(r"\1", text[start:end + 1])
+    try:
+        return json.loads(text)
+    except ValueError as e:
+        raise ClassificationError(f"Invalid JSON in reply: {e}") from None
+
+
+def parse_classification(raw: str) -> dict:
+    """Parse and validate a model reply into {'language', 'intent', 'topics'}."""
+    data = _loads_lenient(raw)
+    if not isinstance(data, dict):
+        raise ClassificationError("Reply is not a JSON object")
+    language = str(data.get("language", "")).strip().lower()
+    language = LANGUAGE_ALIASES.get(language, language)
+    if language not in LANGUAGES:
+        raise ClassificationError(f"Invalid language: {data.get('language')!r}")
+    intent = str(data.get("intent", "")).strip().lower().replace(" ", "_")
+    if intent not in INTENTS:
+        raise ClassificationError(f"Invalid intent: {data.get('intent')!r}")
+    topics = data.get("topics", [])
+    if isinstance(topics, str):
+        topics = [topics]
+    if not isinstance(topics, list):
+        raise ClassificationError("topics must be a list")
+    topics = [str(t).strip() for t in topics if str(t).strip()]
+    return {"language": language, "intent": intent, "topics": topics}
+
+
+class Classifier:
+    """
+    Classifies transcript lines with a forced tool call against a fixed schema,
+    retrying only when the reply cannot be parsed even after local repair.
+    """
+    def __init__(self, client, model: str, max_retries: int = 1):
+        self.client = client
+        self.model = model
+        self.max_retries = max(0, max_retries)
+        self.requests = 0
+        self.parse_failures = 0
+        self.retries = 0
+        self.failures = 0
+
+    async def _request(self, text: str) -> str:
+        """Call the model and return the raw classification arguments."""
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {'role': 'system', 'content': SYSTEM_PROMPT},
+                {'role': 'user',   'content': text},
+            ],
+            tools=[CLASSIFY_TOOL],
+            tool_choice=TOOL_CHOICE,
+        )
+        message = response.choices[0].message
+        if message.tool_calls:
+            return message.tool_calls[0].function.arguments
+        return message.content or ""
+
+    async def classify(self, text: str) -> dict:
+        """Classify a line; returns {'error': ..., 'raw': ...} if every attempt fails to parse."""
+        self.requests += 1
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.retries += 1
+            raw = await self._request(text)
+            try:
+                return parse_classification(raw)
+            except ClassificationError as e:
+                self.parse_failures += 1
+                error = str(e)
+        self.failures += 1
+        return {'error': f'Failed to parse classification: {error}', 'raw': raw}
+
+    def stats(self) -> dict:
+        """Return parse-failure and retry counters and rates."""
+        attempts = self.requests + self.retries
+        return {
+            'requests': self.requests,
+            'parse_failures': self.parse_failures,
+            'retries': self.retries,
+            'failures': self.failures,
+            'parse_failure_rate': self.parse_failures / attempts if attempts else 0.0,
+            'retry_rate': self.retries / self.requests if self.requests else 0.0,
+        }
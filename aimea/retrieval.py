@@ -0,0 +1,80 @@
+"""
+Incremental BM25 index over transcript segments for question answering.
+"""
+import collections
+import heapq
+import math
+import re
+import time
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class TranscriptIndex:
+    """
+    An in-process inverted index over every final transcript segment of a meeting,
+    ranked with Okapi BM25. Unlike RollingBuffer nothing is ever evicted, so older
+    discussion stays retrievable for the whole session.
+    """
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        # Segment metadata indexed by doc id: (timestamp, speaker, text)
+        self._segments = []
+        self._doc_lengths = []
+        self._total_length = 0
+        # term -> list of (doc_id, term_frequency)
+        self._postings = collections.defaultdict(list)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def add(self, text: str, speaker=None, timestamp: float = None) -> None:
+        """Index a transcript segment. Cost is linear in the segment's token count."""
+        tokens = tokenize(text)
+        if not tokens:
+            return
+        doc_id = len(self._segments)
+        if timestamp is None:
+            timestamp = time.time()
+        self._segments.append((timestamp, speaker, text))
+        self._doc_lengths.append(len(tokens))
+        self._total_length += len(tokens)
+        for term, tf in collections.Counter(tokens).items():
+            self._postings[term].append((doc_id, tf))
+
+    def search(self, query: str, k: int = 5) -> list:
+        """
+        Return up to k segments ranked by BM25 relevance to the query, as dicts with
+        'text', 'speaker', 'timestamp' and 'score', ordered chronologically.
+        """
+        n_docs = len(self._segments)
+        if not n_docs or k <= 0:
+            return []
+        avg_length = self._total_length / n_docs
+        scores = collections.defaultdict(float)
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings:
+                norm = self.k1 * (1.0 - self.b + self.b * self._doc_lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * tf * (self.k1 + 1.0) / (tf + norm)
+        top = heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+        results = []
+        for doc_id, score in sorted(top):
+            timestamp, speaker, text = self._segments[doc_id]
+            results.append({
+                'text': text,
+                'speaker': speaker,
+                'timestamp': timestamp,
+                'score': score,
+            })
+        return results
@@ -69,4 +69,24 @@ class Summarizer:
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
         )
-        return response.choices[0].message.content.strip()
\ No newline at end of file
+        return response.choices[0].message.content.strip()
+
+    async def answer(self, question: str, segments: list) -> str:
+        """Answer a question about the meeting using only the given retrieved transcript segments."""
+        lines = []
+        for seg in segments:
+            stamp = time.strftime("%H:%M:%S", time.localtime(seg['timestamp']))
+            speaker = f"Speaker {seg['speaker']}" if seg['speaker'] is not None else "Unknown"
+            lines.append(f"[{stamp}] {speaker}: {seg['text']}")
+        excerpts = "\n".join(lines)
+        prompt = (
+            "You are an AI assistant answering questions about a meeting. "
+            "Use only the following transcript excerpts; if they do not contain the answer, say so.\n\n"
+            f"Excerpts:\n{excerpts}\n\n"
+            f"Question: {question}"
+        )
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return response.choices[0].message.content.strip()
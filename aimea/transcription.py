@@ -8,6 +8,7 @@ import pyaudio
 from deepgram import DeepgramClient, LiveTranscriptionEvents
 
 from aimea.buffer import RollingBuffer
+from aimea.retrieval import TranscriptIndex
 from aimea.config import (
     DEEPGRAM_API_KEY,
     AIMEA_INPUT_DEVICE_NAME,
@@ -20,10 +21,11 @@ from aimea.config import (
 class Transcriber:
     """
     Captures audio from the default input device and streams it to Deepgram for transcription.
-    Internally adds interim transcripts to the rolling buffer.
+    Internally adds interim transcripts to the rolling buffer and, if given, the retrieval index.
     """
-    def __init__(self, buffer: RollingBuffer, sample_rate: int = 44100, channels: int = 2, block_size: int = 1024, input_device_name: str = None):
+    def __init__(self, buffer: RollingBuffer, sample_rate: int = 44100, channels: int = 2, block_size: int = 1024, input_device_name: str = None, index: TranscriptIndex = None):
         self.buffer = buffer
+        self.index = index
         self.sample_rate = sample_rate
         self.channels = channels
         self.block_size = block_size
@@ -51,31 +53,9 @@ class Transcriber:
             print(f"[Analyzer] summarize error: {e}")
 
     async def _classify_line(self, text: str) -> None:
-        """Classify a single transcript line into language, intent, and topics via Azure OpenAI."""
-        import json
-        # Build system instruction and user message for classification
-        system_prompt = (
-            "You are an AI assistant that extracts the language (en or es), intent, and topics from meeting transcript text. "
-            "Output ONLY a JSON object with the following keys: \n"
-            "language: one of \"en\" or \"es\"\n"
-            "intent: one of \"schedule_meeting\", \"send_message\", \"action_item\", or \"other\"\n"
-            "topics: an array of short topic strings (e.g., \"budget\", \"roadmap\")."
-        )
-        messages = [
-            {'role': 'system', 'content': system_prompt},
-            {'role': 'user',   'content': text},
-        ]
+        """Classify a single transcript line into language, intent, and topics via the shared classifier."""
         try:
-            # Call classification endpoint with system and user messages
-            response = await self.summarizer.client.chat.completions.create(
-                model=self.summarizer.model,
-                messages=messages,
-            )
-            content = response.choices[0].message.content.strip()
-            try:
-                result = json.loads(content)
-            except Exception:
-                result = {'error': 'Failed to parse classification', 'raw': content}
+            result = await self.classifier.classify(text)
             print(f"[Classification] {result}")
         except Exception as e:
             print(f"[Analyzer] classification error: {e}")
@@ -149,10 +129,13 @@ class Transcriber:
                 speaker = getattr(alt.words[0], "speaker", None)
             entry = f"Speaker {speaker}: {transcript}" if speaker is not None else transcript
             self.buffer.add(entry)
+            if self.index is not None:
+                self.index.add(transcript, speaker=speaker)
             print(entry)
             # Trigger text-based analysis
-            if hasattr(self, "summarizer"):
+            if hasattr(self, "classifier"):
                 asyncio.create_task(self._classify_line(transcript))
+            if hasattr(self, "summarizer"):
                 asyncio.create_task(self._analyze_buffer())
         socket.on(LiveTranscriptionEvents.Transcript, _on_transcript)
         # Close and error handlers
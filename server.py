@@ -18,8 +18,10 @@ async def cors_middleware(request, handler):
     return resp
 
 from aimea.buffer import RollingBuffer
+from aimea.retrieval import TranscriptIndex
 from aimea.transcription import Transcriber
 from aimea.summarizer import Summarizer
+from aimea.classifier import Classifier
 from aimea.config import (
     AZURE_OPENAI_DEPLOYMENT_NAME,
     DEEPGRAM_API_KEY,
@@ -39,11 +41,18 @@ import subprocess
 
 # Shared buffer and services
 buffer = RollingBuffer(window_seconds=120.0)
-transcriber = Transcriber(buffer)
+# Full-meeting retrieval index backing /ask
+index = TranscriptIndex()
+# Upper bound on segments sent to the LLM per /ask request
+ASK_MAX_SEGMENTS = 20
+transcriber = Transcriber(buffer, index=index)
 # Disable periodic summarization by setting a large interval
 summarizer = Summarizer(buffer, interval=3600.0)
 # Attach summarizer to transcriber for live text analysis
 transcriber.summarizer = summarizer
+# Shared structured-output classifier for live lines and /classify
+classifier = Classifier(summarizer.client, summarizer.model)
+transcriber.classifier = classifier
 transcription_task = None
 
 async def start_transcription(app: web.Application) -> None:
@@ -80,6 +89,33 @@ async def handle_summary(request: web.Request) -> web.Response:
         print(f"Exception in /summary: {e}")
         import traceback; traceback.print_exc()
         return web.json_response({'error': str(e)}, status=500)
+
+async def handle_ask(request: web.Request) -> web.Response:
+    """Answer a question about the meeting from the top-k retrieved transcript segments."""
+    # Parse JSON body, return 400 on invalid JSON
+    try:
+        data = await request.json()
+    except Exception:
+        return web.json_response({'error': 'Invalid JSON body'}, status=400)
+    if not isinstance(data, dict):
+        return web.json_response({'error': 'JSON body must be an object'}, status=400)
+    question = data.get('question', '')
+    if not isinstance(question, str) or not question.strip():
+        return web.json_response({'error': 'No question provided'}, status=400)
+    try:
+        k = int(data.get('k', 5))
+    except (TypeError, ValueError):
+        return web.json_response({'error': 'k must be an integer'}, status=400)
+    # Cap k so the prompt stays bounded regardless of meeting length
+    k = max(1, min(k, ASK_MAX_SEGMENTS))
+    segments = index.search(question, k=k)
+    if not segments:
+        return web.json_response({'answer': '', 'segments': []})
+    try:
+        answer = await summarizer.answer(question, segments)
+        return web.json_response({'answer': answer, 'segments': segments})
+    except Exception as e:
+        return web.json_response({'error': str(e)}, status=500)
     
 async def handle_devices(request: web.Request) -> web.Response:
     """List available input devices."""
@@ -130,7 +166,7 @@ async def handle_select_language(request: web.Request) -> web.Response:
     return web.json_response({'status': 'ok', 'language': lang})
     
 async def handle_classify(request: web.Request) -> web.Response:
-    """Classify a transcript line into intent and topics using Azure OpenAI."""
+    """Classify a transcript line into language, intent, and topics using structured output."""
     # Parse JSON body, return 400 on invalid JSON
     try:
         data = await request.json()
@@ -140,33 +176,15 @@ async def handle_classify(request: web.Request) -> web.Response:
     if not text:
         return web.json_response({'error': 'No text provided'}, status=400)
     try:
-        # Build system instruction and user message for classification
-        system_prompt = (
-            "You are an AI assistant that extracts the language (en or es), intent, and topics from meeting transcript text. "
-            "Output ONLY a JSON object with the following keys: \n"
-            "language: one of \"en\" or \"es\"\n"
-            "intent: one of \"schedule_meeting\", \"send_message\", \"action_item\", or \"other\"\n"
-            "topics: an array of short topic strings (e.g., \"budget\", \"roadmap\")."
-        )
-        messages = [
-            {'role': 'system', 'content': system_prompt},
-            {'role': 'user',   'content': text},
-        ]
-        # Use configured summarizer client (AsyncAzureOpenAI or AsyncClient)
-        response = await summarizer.client.chat.completions.create(
-            model=summarizer.model,
-            messages=messages,
-        )
-        content = response.choices[0].message.content.strip()
-        import json
-        try:
-            result = json.loads(content)
-        except Exception:
-            result = {'error': 'Failed to parse classification', 'raw': content}
+        result = await classifier.classify(text)
         return web.json_response(result)
     except Exception as e:
         return web.json_response({'error': str(e)}, status=500)
 
+async def handle_classify_stats(request: web.Request) -> web.Response:
+    """Return classification parse-failure and retry rates."""
+    return web.json_response(classifier.stats())
+
 async def handle_schedule(request: web.Request) -> web.Response:
     """Create a Google Calendar event based on provided details."""
     # Parse JSON body, return 400 on invalid JSON
@@ -235,6 +253,7 @@ def create_app() -> web.Application:
     app = web.Application(middlewares=[cors_middleware])
     app.router.add_get('/buffer', handle_buffer)
     app.router.add_get('/summary', handle_summary)
+    app.router.add_post('/ask', handle_ask)
     app.router.add_get('/devices', handle_devices)
     app.router.add_post('/device', handle_select_device)
     app.router.add_get('/languages', handle_languages)
@@ -243,6 +262,7 @@ def create_app() -> web.Application:
     # app.on_startup.append(start_transcription)
     app.on_cleanup.append(stop_transcription)
     app.router.add_post('/classify', handle_classify)
+    app.router.add_get('/classify/stats', handle_classify_stats)
     app.router.add_post('/schedule', handle_schedule)
     app.router.add_get('/contacts', handle_contacts)
     app.router.add_post('/message', handle_message)